@@ -2,7 +2,7 @@ import json
 import os
 from datetime import datetime, timedelta
 from decimal import Decimal
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, MagicMock, Mock, patch
 
 import before_after
 import graphene
@@ -56,6 +56,7 @@ from ....thumbnail.models import Thumbnail
 from ....warehouse.models import Allocation, Stock, Warehouse
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.payloads import generate_product_deleted_payload
+from ...channel import ChannelContext
 from ...core.enums import AttributeErrorCode, ReportingPeriod, ThumbnailFormatEnum
 from ...tests.utils import (
     assert_no_permission,
@@ -65,6 +66,7 @@ from ...tests.utils import (
 )
 from ..bulk_mutations.products import ProductVariantStocksUpdate
 from ..enums import VariantAttributeScope
+from ..types import ProductVariant as ProductVariantType
 from ..utils import create_stocks
 
 
@@ -10984,10 +10986,7 @@ def test_product_variant_without_price_as_staff_without_permission(
     stock,
     channel_USD,
 ):
-
-    variant_channel_listing = variant.channel_listings.first()
-    variant_channel_listing.price_amount = None
-    variant_channel_listing.save()
+    variant.channel_listings.filter(channel=channel_USD).update(price_amount=None)
 
     product_id = graphene.Node.to_global_id("Product", variant.product.id)
     variant_id = graphene.Node.to_global_id("ProductVariant", variant.id)
@@ -11011,10 +11010,7 @@ def test_product_variant_without_price_as_staff_without_permission(
 def test_product_variant_without_price_as_staff_with_permission(
     staff_api_client, variant, stock, channel_USD, permission_manage_products
 ):
-
-    variant_channel_listing = variant.channel_listings.first()
-    variant_channel_listing.price_amount = None
-    variant_channel_listing.save()
+    variant.channel_listings.filter(channel=channel_USD).update(price_amount=None)
 
     product_id = graphene.Node.to_global_id("Product", variant.product.id)
     variant_id = graphene.Node.to_global_id("ProductVariant", variant.id)
@@ -11039,38 +11035,26 @@ def test_product_variant_without_price_as_staff_with_permission(
     assert variants_data[1]["pricing"] is None
 
 
-QUERY_GET_PRODUCT_VARIANTS_PRICING_NO_ADDRESS = """
-    query getProductVariants($id: ID!, $channel: String) {
-        product(id: $id, channel: $channel) {
-            variants {
-                id
-                pricing {
-                    priceUndiscounted {
-                        gross {
-                            amount
-                        }
-                    }
-                }
-            }
-        }
-    }
-"""
-
-
 @patch(
     "saleor.graphql.product.types.products.get_variant_availability",
     wraps=get_variant_availability,
 )
 def test_product_variant_price_no_address(
-    mock_get_variant_availability, user_api_client, variant, stock, channel_USD
+    mock_get_variant_availability, variant, stock, channel_USD
 ):
+    # given
     channel_USD.default_country = "FR"
     channel_USD.save()
-    product_id = graphene.Node.to_global_id("Product", variant.product.id)
-    variables = {"id": product_id, "channel": channel_USD.slug}
-    user_api_client.post_graphql(
-        QUERY_GET_PRODUCT_VARIANTS_PRICING_NO_ADDRESS, variables
+    root = ChannelContext(node=variant, channel_slug=channel_USD.slug)
+    info = Mock(
+        context=Mock(user=None, app=None, dataloaders={}, request_time=timezone.now())
     )
+
+    # when
+    pricing = ProductVariantType.resolve_pricing(root, info).get()
+
+    # then
+    assert pricing
     assert (
         mock_get_variant_availability.call_args[1]["country"]
         == channel_USD.default_country
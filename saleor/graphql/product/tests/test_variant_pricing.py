@@ -1,11 +1,14 @@
 from unittest.mock import Mock
 
+import pytest
 from django_countries.fields import Country
+from graphql.backend import GraphQLCachedBackend, get_default_backend
 from prices import Money, TaxedMoney
 
 from ....plugins.manager import PluginsManager, get_plugins_manager
 from ....product.models import ProductVariant
 from ....product.utils.availability import get_variant_availability
+from ...api import schema
 from ...tests.utils import get_graphql_content
 
 QUERY_GET_VARIANT_PRICING = """
@@ -48,39 +51,38 @@ query ($channel: String, $address: AddressInput) {
 }
 """
 
+# Documents are parsed once at import and reused by the API view for every
+# request sent from this module.
+cached_backend = GraphQLCachedBackend(get_default_backend())
+cached_backend.document_from_string(schema, QUERY_GET_VARIANT_PRICING)
 
-def test_get_variant_pricing_on_sale(api_client, sale, product, channel_USD):
-    price = product.variants.first().channel_listings.get().price
-    sale_discounted_value = sale.channel_listings.get().discount_value
-    discounted_price = price.amount - sale_discounted_value
-
-    variables = {"channel": channel_USD.slug, "address": {"country": "US"}}
-    response = api_client.post_graphql(QUERY_GET_VARIANT_PRICING, variables)
-    content = get_graphql_content(response)
-
-    pricing = content["data"]["products"]["edges"][0]["node"]["variants"][0]["pricing"]
-
-    # ensure the availability was correctly retrieved and sent
-    assert pricing
 
-    # check availability
-    assert pricing["onSale"] is True
-
-    # check the discount
-    assert pricing["discount"]["currency"] == price.currency
-    assert pricing["discount"]["net"]["amount"] == discounted_price
+@pytest.fixture(autouse=True)
+def use_cached_backend(monkeypatch):
+    monkeypatch.setattr(
+        "saleor.graphql.views.get_default_backend", lambda: cached_backend
+    )
 
-    # check the undiscounted price
-    assert pricing["priceUndiscounted"]["currency"] == price.currency
-    assert pricing["priceUndiscounted"]["net"]["amount"] == price.amount
 
-    # check the discounted price
-    assert pricing["price"]["currency"] == price.currency
-    assert pricing["price"]["net"]["amount"] == discounted_price
+@pytest.fixture
+def with_sale(request):
+    if request.param:
+        return request.getfixturevalue("sale")
+    return None
 
 
-def test_get_variant_pricing_not_on_sale(api_client, product, channel_USD):
+@pytest.mark.parametrize(
+    "with_sale, expected_on_sale",
+    [(True, True), (False, False)],
+    indirect=["with_sale"],
+)
+def test_get_variant_pricing(
+    with_sale, expected_on_sale, api_client, product, channel_USD
+):
     price = product.variants.first().channel_listings.get().price
+    discounted_price = price.amount
+    if with_sale:
+        discounted_price -= with_sale.channel_listings.get().discount_value
 
     variables = {"channel": channel_USD.slug, "address": {"country": "US"}}
     response = api_client.post_graphql(QUERY_GET_VARIANT_PRICING, variables)
@@ -92,10 +94,14 @@ def test_get_variant_pricing_not_on_sale(api_client, product, channel_USD):
     assert pricing
 
     # check availability
-    assert pricing["onSale"] is False
+    assert pricing["onSale"] is expected_on_sale
 
     # check the discount
-    assert pricing["discount"] is None
+    if with_sale:
+        assert pricing["discount"]["currency"] == price.currency
+        assert pricing["discount"]["net"]["amount"] == discounted_price
+    else:
+        assert pricing["discount"] is None
 
     # check the undiscounted price
     assert pricing["priceUndiscounted"]["currency"] == price.currency
@@ -103,12 +109,10 @@ def test_get_variant_pricing_not_on_sale(api_client, product, channel_USD):
 
     # check the discounted price
     assert pricing["price"]["currency"] == price.currency
-    assert pricing["price"]["net"]["amount"] == price.amount
+    assert pricing["price"]["net"]["amount"] == discounted_price
 
 
-def test_variant_pricing(
-    variant: ProductVariant, monkeypatch, settings, stock, channel_USD
-):
+def test_variant_pricing(variant: ProductVariant, monkeypatch, settings, channel_USD):
     taxed_price = TaxedMoney(Money("10.0", "USD"), Money("12.30", "USD"))
     monkeypatch.setattr(
         PluginsManager, "apply_taxes_to_product", Mock(return_value=taxed_price)
@@ -131,6 +135,8 @@ def test_variant_pricing(
         country=Country("US"),
     )
     assert pricing.price == taxed_price
+    assert pricing.price.tax.amount
+    assert pricing.price_undiscounted.tax.amount
     assert pricing.price_local_currency is None
 
     monkeypatch.setattr(
@@ -153,18 +159,3 @@ def test_variant_pricing(
         country=Country("US"),
     )
     assert pricing.price_local_currency.currency == "PLN"  # type: ignore
-
-    pricing = get_variant_availability(
-        variant=variant,
-        variant_channel_listing=variant_channel_listing,
-        product=product,
-        product_channel_listing=product_channel_listing,
-        collections=[],
-        discounts=[],
-        channel=channel_USD,
-        plugins=manager,
-        country=Country("PL"),
-    )
-    assert pricing.price.tax.amount
-    assert pricing.price_undiscounted.tax.amount
-    assert pricing.price_undiscounted.tax.amount